@@ -3,8 +3,11 @@ import json, sys
 from pathlib import Path
 from jsonschema import Draft202012Validator
 
-ROOT = Path(__file__).resolve().parents[1]
+ROOT = Path(__file__).resolve().parents[2]
 SCHEMA = json.loads((ROOT/"schemas"/"devotion.schema.json").read_text(encoding="utf-8"))
+Draft202012Validator.check_schema(SCHEMA)
+# Entries are checked one by one, so validate against the per-item schema of the array
+ITEM_VALIDATOR = Draft202012Validator(SCHEMA.get("items", SCHEMA))
 
 def coerce(item: dict) -> dict:
     # Back-compat: if an older record has theologicalSummary, map it to theologicalSynthesis
@@ -21,11 +24,13 @@ def validate_array(path: Path) -> int:
         data = [data]
     if not isinstance(data, list):
         print(f"[error] {path} must be JSON array or object"); return 1
-    validator = Draft202012Validator(SCHEMA)
     errors = 0
     for i, raw in enumerate(data):
         item = coerce(raw if isinstance(raw, dict) else {})
-        for err in validator.iter_errors(item):
+        # Cheap pass first; only collect error details for entries that fail
+        if ITEM_VALIDATOR.is_valid(item):
+            continue
+        for err in ITEM_VALIDATOR.iter_errors(item):
             loc = "/".join(map(str, err.path)) or "(root)"
             print(f"[invalid] {path} idx={i} field={loc}: {err.message}")
             errors += 1
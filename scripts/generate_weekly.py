@@ -11,13 +11,31 @@ Updates:
 - Proper liturgical cycles (Year A/B/C, Cycle I/II).
 - CatholicGallery / Catholic.org / EWTN as fallbacks for readings.
 - USCCB parsing based on visible headers.
+- GEN_BATCH=1 submits all day prompts as one OpenAI Batch job (backfills/manual runs).
+  A batch still running after BATCH_MAX_WAIT seconds is cancelled and its days run one by one.
+- GEN_MULTIDAY=N asks for N days per chat completion; days it drops are redone one by one.
+- GEN_NO_TEMP=1 never sends `temperature` (needed up front for batch runs on models that reject it).
+- Feed is checkpointed after every finished day; failed days are reported at exit.
+- GEN_MAX_CALLS caps OpenAI requests per run (default 100, 0 = no cap); usage is logged at exit.
 """
 
-import os, re, json, time, zoneinfo, datetime as dt
-from typing import Dict, Any, Tuple, List
+import os, re, json, time, random, hashlib, tempfile, threading, zoneinfo, datetime as dt
+from typing import Dict, Any, Tuple, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup, NavigableString, Tag
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from jsonschema import Draft202012Validator
+except ImportError:
+    Draft202012Validator = None
 from collections import Counter
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ===== Config =====
 APP_TZ = os.getenv("APP_TZ", "America/New_York")
@@ -30,6 +48,22 @@ SAINT_JSON_URL     = os.getenv("SAINT_JSON_URL", "https://dailylectio.org/saint.
 GEN_MODEL          = os.getenv("GEN_MODEL", "gpt-5-mini")
 GEN_FALLBACK       = os.getenv("GEN_FALLBACK", "gpt-5-mini")
 GEN_TEMP           = float(os.getenv("GEN_TEMP", "1"))
+GEN_NO_TEMP        = os.getenv("GEN_NO_TEMP", "0") == "1"   # models reject `temperature`: never send it
+GEN_RETRIES        = int(os.getenv("GEN_RETRIES", "4"))   # extra attempts on 429/5xx/timeouts
+GEN_TIMEOUT        = float(os.getenv("GEN_TIMEOUT", "300"))   # seconds per OpenAI request
+GEN_MAX_CALLS      = int(os.getenv("GEN_MAX_CALLS", "100"))   # cap on OpenAI requests per run (0 = no cap)
+GEN_CONCURRENCY    = max(1, int(os.getenv("GEN_CONCURRENCY", "4")))  # days generated in parallel
+GEN_BATCH          = os.getenv("GEN_BATCH", "0") == "1"   # Batch API: half price, up to 24h turnaround
+GEN_MULTIDAY       = max(1, int(os.getenv("GEN_MULTIDAY", "1")))   # days per chat completion (1 = one call per day)
+BATCH_POLL_SECS    = int(os.getenv("BATCH_POLL_SECS", "30"))
+BATCH_MAX_WAIT     = int(os.getenv("BATCH_MAX_WAIT", "7200"))   # seconds before a batch is cancelled and days run one by one
+GEN_FORCE          = os.getenv("GEN_FORCE", "0") == "1"   # regenerate days already complete in the feed
+
+WEEKLY_PATH        = "public/weeklyfeed.json"
+SCHEMA_PATH        = "schemas/devotion.schema.json"
+CACHE_DIR          = os.getenv("GEN_CACHE_DIR", ".cache")
+USCCB_CACHE_DAYS   = float(os.getenv("USCCB_CACHE_DAYS", "1"))   # max age for cached pages of upcoming days
+GEN_NO_CACHE       = os.getenv("GEN_NO_CACHE", "0") == "1"   # ignore cached completions
 
 # Use a "real" browser UA to avoid weird mobile/anti-bot versions of USCCB/Catholic.org
 HEADERS = {
@@ -41,22 +75,89 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
+# One keep-alive pool for every scrape: days run in parallel and each hits the
+# same handful of hosts, so reuse connections instead of a TLS handshake per GET.
+_retry = Retry(total=3, backoff_factor=0.5,
+               status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=("GET",), raise_on_status=False)
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_retry)
+
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# bs4 tree builder: lxml parses pages several times faster than the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # ===== Utils =====
 def _s(x: object) -> str:
     return x if isinstance(x, str) else ("" if x is None else str(x))
 
+def _sfield(d: Dict[str, Any], k: str, default: str = "") -> str:
+    """d[k] as a stripped str; `default` when the key is missing or null."""
+    v = d.get(k)
+    return default if v is None else _s(v).strip()
+
 def log(*a): print("[info]", *a, flush=True)
+def load_once(fn):
+    """lru_cache for a no-arg loader, locked so day threads calling it together run it once."""
+    cached = lru_cache(maxsize=None)(fn)
+    lock = threading.Lock()
+    @wraps(fn)
+    def wrapper():
+        with lock:
+            return cached()
+    return wrapper
 def today_local() -> dt.date: return dt.datetime.now(TZ).date()
 def ymd(d: dt.date) -> str: return d.isoformat()
 def daterange(start: dt.date, days: int) -> List[dt.date]:
     return [start + dt.timedelta(days=i) for i in range(days)]
 def load_json(path, default):
     try:
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception:
         return default
 def is_sunday(d: dt.date) -> bool: return d.weekday() == 6
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    d = os.path.dirname(path) or "."
+    os.makedirs(d, exist_ok=True)
+    # Unique temp per call: day and source threads write concurrently.
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path), dir=d)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        try:
+            if os.path.exists(tmp): os.remove(tmp)
+        except Exception:
+            pass
+def write_bytes_if_changed(path: str, data: bytes) -> bool:
+    """Atomically write `data` unless `path` already holds exactly these bytes."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    write_bytes_atomic(path, data)
+    return True
+def write_text_atomic(path: str, text: str) -> None:
+    write_bytes_atomic(path, text.encode("utf-8"))
+def dump_json_pretty(obj: Any) -> bytes:
+    """UTF-8, 2-space indent; orjson and the stdlib fallback produce identical bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 # ===== Liturgical cycles =====
 def _first_sunday_of_advent(year: int) -> dt.date:
@@ -76,15 +177,10 @@ def compute_weekday_cycle(d: dt.date) -> str:
     return "Cycle I" if d.year % 2 == 1 else "Cycle II"
 
 # ===== Regex =====
-REF_RE = re.compile(
-    r'\b(?:[1-3]\s*)?'
-    r'(?:Genesis|Exodus|Leviticus|Numbers|Deuteronomy|Joshua|Judges|Ruth|Samuel|Kings|Chronicles|Ezra|Nehemiah|Tobit|Judith|Esther|Job|Psalms?|Proverbs|Ecclesiastes|Qoheleth|Song(?: of Songs)?|Wisdom|Sirach|Isaiah|Jeremiah|Lamentations|Baruch|Ezekiel|Daniel|Hosea|Joel|Amos|Obadiah|Jonah|Micah|Nahum|Habakkuk|Zephaniah|Haggai|Zechariah|Malachi|Matthew|Mark|Luke|John|Acts|Romans|Corinthians|Galatians|Ephesians|Philippians|Colossians|Thessalonians|Timothy|Titus|Philemon|Hebrews|James|Peter|Jude|Revelation)'
-    r'\s+\d+(?::\d+[a-z]*?(?:-\d+)?(?:,\s*\d+[a-z]*?(?:-\d+)?)*)?',
-    re.I,
-)
-
 # Psalm *book* detection (for safety checks)
 PSALM_REF_RE = re.compile(r'^(?:Ps|Psalm|Psalms)\s+\d+', re.I)
+WS_RE          = re.compile(r'\s+')
+LECTIONARY_RE  = re.compile(r'Lectionary.*', re.I)
 
 # ===== DOM helpers =====
 def text_of(node: Tag) -> str:
@@ -105,21 +201,12 @@ def siblings_text_until_next_heading(h: Tag) -> str:
             out.append(t)
     return " ".join(out)
 
-def pagewide_psalm_fallback(html: str) -> str:
-    m = re.search(
-        r'(?:^|\s)((?:Ps(?:alm|alms)?|Psalm|Psalms)\s+\d+'
-        r'(?::\d+[a-z]*?(?:-\d+)?(?:,\s*\d+[a-z]*?(?:-\d+)?)*)?)',
-        html,
-        re.I,
-    )
-    return m.group(1).strip() if m else ""
-
 # ===== tiny voter Helper =====
 def _canon(ref: str) -> str:
     """Canonicalize a scripture ref for comparison."""
     if not ref:
         return ""
-    ref = re.sub(r'\s+', ' ', ref)          # collapse whitespace
+    ref = WS_RE.sub(' ', ref)               # collapse whitespace
     ref = ref.replace("First ", "1 ")
     ref = ref.replace("Second ", "2 ")
     ref = ref.replace("Third ", "3 ")
@@ -142,45 +229,60 @@ def _vote_slot(*candidates: str) -> str:
     return clean[0]
 
 # ===== USCCB parser (text-first) =====
-def parse_usccb_dom(html: str, sunday: bool) -> Tuple[str, str, str, str]:
-    soup = BeautifulSoup(html, "html.parser")
+# USCCB section headers, matched in a single pass over the page's text nodes
+USCCB_HEADERS = {
+    "first":    re.compile(r"Reading\s+(1|I)(\s|$)", re.I),
+    "second":   re.compile(r"Reading\s+(2|II)(\s|$)", re.I),
+    "psalm":    re.compile(r"(Responsorial\s+Psalm|Responsorial|Psalm)", re.I),
+    "gospel":   re.compile(r"^Gospel(\s|$)", re.I),
+    "alleluia": re.compile(r"Alleluia", re.I),
+}
 
-    found = {
-        "first": "",
-        "second": "",
-        "psalm": "",
-        "gospel": ""
-    }
+def _find_headers(soup: BeautifulSoup) -> Dict[str, NavigableString]:
+    """First text node matching each USCCB_HEADERS pattern, in document order."""
+    found: Dict[str, NavigableString] = {}
+    for text in soup.find_all(string=True):
+        for key, pat in USCCB_HEADERS.items():
+            if key not in found and pat.search(text):
+                found[key] = text
+        if len(found) == len(USCCB_HEADERS):
+            break
+    return found
 
-    def get_citation_after_header(header_text_pattern: str) -> str:
-        header = soup.find(string=re.compile(header_text_pattern, re.I))
-        if not header:
-            return ""
-        container = header.parent
-        internal_link = container.find("a")
-        if internal_link:
-            return internal_link.get_text(" ", strip=True)
-        sibling = container.next_sibling
-        for _ in range(5):
-            if not sibling:
-                break
-            if isinstance(sibling, Tag):
-                text = sibling.get_text(" ", strip=True)
-                if any(ch.isdigit() for ch in text):
-                    return text
-            sibling = sibling.next_sibling
+def _citation_after_header(header) -> str:
+    if not header:
         return ""
+    container = header.parent
+    internal_link = container.find("a")
+    if internal_link:
+        return internal_link.get_text(" ", strip=True)
+    sibling = container.next_sibling
+    for _ in range(5):
+        if not sibling:
+            break
+        if isinstance(sibling, Tag):
+            text = sibling.get_text(" ", strip=True)
+            if any(ch.isdigit() for ch in text):
+                return text
+        sibling = sibling.next_sibling
+    return ""
 
-    found["first"] = get_citation_after_header(r"Reading\s+(1|I)(\s|$)")
-    found["second"] = get_citation_after_header(r"Reading\s+(2|II)(\s|$)")
-    found["psalm"] = get_citation_after_header(r"(Responsorial\s+Psalm|Responsorial|Psalm)")
-    found["gospel"] = get_citation_after_header(r"^Gospel(\s|$)")
+def parse_usccb_dom(html: str, sunday: bool) -> Tuple[str, str, str, str]:
+    soup = BeautifulSoup(html, HTML_PARSER)
+    headers = _find_headers(soup)
+
+    found = {
+        "first": _citation_after_header(headers.get("first")),
+        "second": _citation_after_header(headers.get("second")),
+        "psalm": _citation_after_header(headers.get("psalm")),
+        "gospel": _citation_after_header(headers.get("gospel")),
+    }
     if not found["gospel"]:
-        found["gospel"] = get_citation_after_header(r"Alleluia")
+        found["gospel"] = _citation_after_header(headers.get("alleluia"))
 
     for k in found:
         txt = found[k] or ""
-        txt = re.sub(r"Lectionary.*", "", txt, flags=re.I)
+        txt = LECTIONARY_RE.sub("", txt)
         txt = txt.replace("\n", " ").strip()
         found[k] = txt
 
@@ -189,62 +291,110 @@ def parse_usccb_dom(html: str, sunday: bool) -> Tuple[str, str, str, str]:
 
     return found["first"] or "", found["second"] or "", found["psalm"] or "", found["gospel"] or ""
 
-def fetch_readings_usccb(date: dt.date) -> Tuple[str, str, str, str]:
-    url = f"https://bible.usccb.org/bible/readings/{date.strftime('%m%d%y')}.cfm"
-    r = requests.get(url, headers=HEADERS, timeout=25)
+@lru_cache(maxsize=64)
+def usccb_link(date: dt.date) -> str:
+    return f"https://bible.usccb.org/bible/readings/{date.strftime('%m%d%y')}.cfm"
+
+def _usccb_cache_path(date: dt.date) -> str:
+    return os.path.join(CACHE_DIR, "usccb", f"{ymd(date)}.html")
+
+def _usccb_cached_page(date: dt.date) -> str:
+    """Cached USCCB page for `date` if still fresh, else ""."""
+    path = _usccb_cache_path(date)
+    try:
+        age_days = (time.time() - os.path.getmtime(path)) / 86400
+        # Readings for a day that has passed never change; upcoming days may still be corrected.
+        if date < today_local() or age_days < USCCB_CACHE_DAYS:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+    except OSError:
+        pass
+    return ""
+
+def usccb_page(date: dt.date) -> str:
+    """Live USCCB readings page for `date`."""
+    r = SESSION.get(usccb_link(date), timeout=25)
     r.raise_for_status()
 
     # Detect Cloudflare/Obolus bot-protection challenge page (served as 200 or 403)
     if "X_Obolus_Proof" in r.text or "Checking connection" in r.text:
         raise ValueError(f"USCCB bot-protection challenge for {ymd(date)} — skipping")
 
-    first, second, psalm, gospel = parse_usccb_dom(r.text, sunday=is_sunday(date))
+    return r.text
+
+def fetch_readings_usccb(date: dt.date) -> Tuple[str, str, str, str]:
+    html = _usccb_cached_page(date)
+    fetched = not html
+    if fetched:
+        html = usccb_page(date)
+    first, second, psalm, gospel = parse_usccb_dom(html, sunday=is_sunday(date))
 
     if not any([first, psalm, gospel]):
         log(f"!! FAIL parsing {ymd(date)} – empty readings from USCCB.")
+    elif fetched and first and psalm and gospel:
+        # Only pages that parsed fully are kept; placeholders are fetched again next run.
+        write_text_atomic(_usccb_cache_path(date), html)
     return first, second, psalm, gospel
 
+# ===== Secondary sources (page-text scraping) =====
+# A citation sits right after its label, so only a short window past the label is searched.
+GRAB_WINDOW = 2000
+
+def _grab_after(text: str, label: str, stop: re.Pattern) -> str:
+    """Text following the first `label`, up to the first `stop` match within GRAB_WINDOW chars."""
+    i = text.find(label)
+    if i < 0:
+        return ""
+    i += len(label)
+    window = text[i:i + GRAB_WINDOW]
+    m = stop.search(window)
+    return (window[:m.start()] if m else window).strip()
+
+def _stops(*labels: str) -> re.Pattern:
+    return re.compile("|".join(map(re.escape, labels)))
+
+_GALLERY_COMMON = ("Lectionary:", "First Reading:", "Second Reading:")
+GALLERY_STOPS = {
+    "First Reading:":      _stops("Responsorial Psalm:", "Gospel:", *_GALLERY_COMMON),
+    "Responsorial Psalm:": _stops("Alleluia:", "Gospel:", *_GALLERY_COMMON),
+    "Second Reading:":     _stops("Responsorial Psalm:", "Gospel:", *_GALLERY_COMMON),
+    "Gospel:":             _stops(*_GALLERY_COMMON),
+}
+CATHOLICORG_STOP = re.compile(r"\s+(?:Reading\s+\d+,|Responsorial Psalm,|Gospel,|Alleluia,|Printable)")
+GALLERY_LABEL_RE = re.compile(r'^\bFirst\b|\bSecond\b|\bReading\b|Responsorial Psalm\b', re.I)
+
 # --- CatholicGallery secondary source ---
 def fetch_readings_catholicgallery(date: dt.date) -> Tuple[str, str, str, str]:
     slug = date.strftime("%d%m%y")
     url = f"https://www.catholicgallery.org/mass-reading/{slug}/"
-    r = requests.get(url, headers=HEADERS, timeout=25)
+    r = SESSION.get(url, timeout=25)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = BeautifulSoup(r.text, HTML_PARSER)
     text = soup.get_text(" ", strip=True)
 
-    def grab(label: str, next_labels: List[str]) -> str:
-        stops = list(next_labels) + ["Lectionary:", "First Reading:", "Second Reading:"]
-        alt = "|".join(map(re.escape, stops))
-        pattern = rf"{re.escape(label)}\s*(.+?)(?={alt}|$)"
-        m = re.search(pattern, text, re.DOTALL)
-        return m.group(1).strip() if m else ""
+    def grab(label: str) -> str:
+        return _grab_after(text, label, GALLERY_STOPS[label])
 
-    first  = grab("First Reading:", ["Responsorial Psalm:", "Gospel:"])
-    psalm  = grab("Responsorial Psalm:", ["Alleluia:", "Gospel:"])
-    second = grab("Second Reading:", ["Responsorial Psalm:", "Gospel:"])
-    gosp   = grab("Gospel:", ["Lectionary:", "First Reading:"])
+    first  = grab("First Reading:")
+    psalm  = grab("Responsorial Psalm:")
+    second = grab("Second Reading:")
+    gosp   = grab("Gospel:")
 
     def norm(s: str) -> str:
-        s = re.sub(r'\s+', ' ', s)
-        s = re.sub(r'^\bFirst\b|\bSecond\b|\bReading\b|Responsorial Psalm\b', '', s, flags=re.I)
+        s = WS_RE.sub(' ', s)
+        s = GALLERY_LABEL_RE.sub('', s)
         return s.strip(" :.,")
     return norm(first), norm(second), norm(psalm), norm(gosp)
 
 def fetch_readings_catholicorg(date: dt.date) -> Tuple[str, str, str, str]:
     url = f"https://www.catholic.org/bible/daily_reading/?select_date={date.isoformat()}"
-    r = requests.get(url, headers=HEADERS, timeout=25)
+    r = SESSION.get(url, timeout=25)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = BeautifulSoup(r.text, HTML_PARSER)
     text = soup.get_text(" ", strip=True)
 
     def grab(label: str) -> str:
-        m = re.search(
-            rf"{re.escape(label)}\s*(.+?)(?=\s+(?:Reading\s+\d+,|Responsorial Psalm,|Gospel,|Alleluia,|Printable)|$)",
-            text,
-            re.DOTALL,
-        )
-        return m.group(1).strip() if m else ""
+        return _grab_after(text, label, CATHOLICORG_STOP)
 
     first  = grab("Reading 1,")
     psalm  = grab("Responsorial Psalm,")
@@ -252,19 +402,19 @@ def fetch_readings_catholicorg(date: dt.date) -> Tuple[str, str, str, str]:
     gosp   = grab("Gospel,")
 
     def norm(s: str) -> str:
-        s = re.sub(r'\s+', ' ', s)
+        s = WS_RE.sub(' ', s)
         return s.strip(" .,")
 
     return norm(first), norm(second), norm(psalm), norm(gosp)
 
 def fetch_readings_ewtn(date: dt.date) -> Tuple[str, str, str, str]:
     url = "https://www.ewtn.com/catholicism/daily-readings"
-    r = requests.get(url, headers=HEADERS, timeout=25)
+    r = SESSION.get(url, timeout=25)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
-    label = date.strftime("%B %-d").replace(" 0", " ")
+    soup = BeautifulSoup(r.text, HTML_PARSER)
+    label = date.strftime("%B %-d").replace(" 0", " ").lower()
     txt = ""
-    for el in soup.find_all(string=re.compile(label, re.I)):
+    for el in soup.find_all(string=lambda t: label in t.lower()):
         try:
             txt = el.parent.get_text(" ", strip=True)
             break
@@ -273,34 +423,48 @@ def fetch_readings_ewtn(date: dt.date) -> Tuple[str, str, str, str]:
     html = txt or soup.get_text(" ", strip=True)
     return parse_usccb_dom(html, sunday=is_sunday(date))
 
-def resolve_readings(date: dt.date) -> Tuple[str, str, str, str]:
-    src = {
-        "usccb":   ("", "", "", ""),
-        "gallery": ("", "", "", ""),
-        "corg":    ("", "", "", ""),
-        "ewtn":    ("", "", "", ""),
-    }
-
-    try:
-        src["usccb"] = fetch_readings_usccb(date)
-    except Exception as e:
-        log("USCCB fetch issue", ymd(date), e)
+READING_SOURCES = (
+    ("usccb",   "USCCB",           fetch_readings_usccb),
+    ("gallery", "CatholicGallery", fetch_readings_catholicgallery),
+    ("corg",    "Catholic.org",    fetch_readings_catholicorg),
+    ("ewtn",    "EWTN",            fetch_readings_ewtn),
+)
 
+def _fetch_source(label: str, fetch, date: dt.date) -> Tuple[str, str, str, str]:
     try:
-        src["gallery"] = fetch_readings_catholicgallery(date)
+        return fetch(date)
     except Exception as e:
-        log("CatholicGallery fetch issue", ymd(date), e)
+        log(f"{label} fetch issue", ymd(date), e)
+        return ("", "", "", "")
 
-    try:
-        src["corg"] = fetch_readings_catholicorg(date)
-    except Exception as e:
-        log("Catholic.org fetch issue", ymd(date), e)
+def _readings_cache_path(date: dt.date) -> str:
+    return os.path.join(CACHE_DIR, "readings", f"{ymd(date)}.json")
 
-    if USE_EWTN_FALLBACK:
-        try:
-            src["ewtn"] = fetch_readings_ewtn(date)
-        except Exception as e:
-            log("EWTN fetch issue", ymd(date), e)
+def resolve_readings(date: dt.date) -> Tuple[str, str, str, str]:
+    """Voted (first, second, psalm, gospel) refs; a past day's complete result is reused from disk."""
+    path = _readings_cache_path(date)
+    if date < today_local():
+        cached = load_json(path, None)
+        if isinstance(cached, list) and len(cached) == 4:
+            log("resolved", ymd(date), "(cached)")
+            return tuple(cached)
+
+    refs = _resolve_readings_live(date)
+    first, _, psalm, gospel = refs
+    if first and psalm and gospel:
+        write_text_atomic(path, json.dumps(list(refs), ensure_ascii=False))
+    return refs
+
+def _resolve_readings_live(date: dt.date) -> Tuple[str, str, str, str]:
+    src = {key: ("", "", "", "") for key, _, _ in READING_SOURCES}
+    wanted = [s for s in READING_SOURCES if s[0] != "ewtn" or USE_EWTN_FALLBACK]
+
+    # Independent pages on different hosts: fetch them side by side so a day
+    # costs one (slowest) page latency instead of the sum of four.
+    with ThreadPoolExecutor(max_workers=len(wanted)) as pool:
+        futures = {key: pool.submit(_fetch_source, label, fetch, date) for key, label, fetch in wanted}
+    for key, fut in futures.items():
+        src[key] = fut.result()
 
     f_u, s_u, p_u, g_u = src["usccb"]
     f_g, s_g, p_g, g_g = src["gallery"]
@@ -316,7 +480,7 @@ def resolve_readings(date: dt.date) -> Tuple[str, str, str, str]:
         log("first reading looks like psalm; clearing first", first)
         first = ""
 
-    if psalm and not re.search(r'\d', psalm):
+    if psalm and not any(ch.isdigit() for ch in psalm):
         log("psalm ref looks wrong; clearing psalm", psalm)
         psalm = ""
 
@@ -329,6 +493,8 @@ def resolve_readings(date: dt.date) -> Tuple[str, str, str, str]:
     return first or "", second or "", psalm or "", gospel or ""
 
 # ===== Saints (Online Primary, JSON Backup) =====
+SAINT_LINK_RE = re.compile(r"/saints/saint\.php\?saint_id=")
+
 def fetch_saint_online(date: dt.date) -> Dict[str, Any]:
     """
     Scrape Catholic.org for the Saint of the Day.
@@ -336,11 +502,11 @@ def fetch_saint_online(date: dt.date) -> Dict[str, Any]:
     """
     try:
         url = f"https://www.catholic.org/saints/day.php?day={date.day}&month={date.month}"
-        r = requests.get(url, headers=HEADERS, timeout=15)
+        r = SESSION.get(url, timeout=15)
         if r.status_code != 200:
             return {}
         
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.text, HTML_PARSER)
         
         # Catholic.org lists saints in a clean list or a "Saint of the Day" block
         # Strategy: Look for the first <h3> or <h4> inside the content area that has a link
@@ -357,7 +523,7 @@ def fetch_saint_online(date: dt.date) -> Dict[str, Any]:
         # Catholic.org links usually look like /saints/saint.php?saint_id=...
         
         candidates = []
-        for a in soup.find_all("a", href=re.compile(r"/saints/saint\.php\?saint_id=")):
+        for a in soup.find_all("a", href=SAINT_LINK_RE):
             name = a.get_text(" ", strip=True)
             if name and len(name) > 3:
                 # Basic filter to avoid navigation links
@@ -394,13 +560,22 @@ def saints_local() -> List[Dict[str, Any]]:
 
 def saints_remote() -> List[Dict[str, Any]]:
     try:
-        r = requests.get(SAINT_JSON_URL, headers=HEADERS, timeout=20)
+        r = SESSION.get(SAINT_JSON_URL, timeout=20)
         if r.status_code == 200:
             return r.json()
     except Exception as e:
         log("saints remote fail:", e)
     return []
 
+@load_once
+def saints_backup() -> Dict[str, Dict[str, Any]]:
+    """Remote + local saint rows merged by date (local wins); fetched once per run."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for row in saints_remote() + saints_local():
+        if isinstance(row, dict) and row.get("date"):
+            merged.setdefault(row["date"], {}).update(row)
+    return merged
+
 def saint_for_date(d: dt.date) -> Dict[str, Any]:
     iso = ymd(d)
     
@@ -410,18 +585,8 @@ def saint_for_date(d: dt.date) -> Dict[str, Any]:
         log(f"Found Saint (Online): {online_data['saintName']}")
         return online_data
 
-    # 2. Consolidate Local + Remote JSON (Backup)
-    merged: Dict[str, Dict[str, Any]] = {}
-    
-    # Remote first (higher priority in backup chain?), then Local overrides? 
-    # Usually Local overrides Remote.
-    all_rows = saints_remote() + saints_local()
-    
-    for row in all_rows:
-        if isinstance(row, dict) and row.get("date"):
-            merged.setdefault(row["date"], {}).update(row)
-            
-    backup_data = merged.get(iso, {}).copy()
+    # 2. Local + Remote JSON (Backup)
+    backup_data = saints_backup().get(iso, {}).copy()
     
     if backup_data.get("saintName"):
         log(f"Found Saint (Backup JSON): {backup_data['saintName']}")
@@ -433,40 +598,211 @@ def saint_for_date(d: dt.date) -> Dict[str, Any]:
 def openai_client():
     from openai import OpenAI
     project = os.getenv("OPENAI_PROJECT") or None
-    return OpenAI(project=project) if project else OpenAI()
+    # _with_backoff owns retries; SDK-level retries on top would multiply the attempts.
+    kw = {"timeout": GEN_TIMEOUT, "max_retries": 0}
+    return OpenAI(project=project, **kw) if project else OpenAI(**kw)
+
+def _with_backoff(call):
+    """Run `call`, retrying rate-limit/timeout/connection/5xx errors with jittered exponential backoff."""
+    from openai import RateLimitError, APIConnectionError, InternalServerError
+    for attempt in range(GEN_RETRIES + 1):
+        try:
+            return call()
+        except (RateLimitError, APIConnectionError, InternalServerError) as e:
+            if attempt == GEN_RETRIES:
+                raise
+            delay = min(30.0, 2.0 ** attempt) * random.uniform(0.5, 1.0)
+            log(f"OpenAI {type(e).__name__}; retry {attempt + 1}/{GEN_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+
+# Requests sent / tokens billed this run, shared by the day threads
+USAGE = {"calls": 0, "tokens": 0}
+_usage_lock = threading.Lock()
+
+def _spend_calls(n: int = 1) -> None:
+    """Reserve `n` requests against GEN_MAX_CALLS, or raise once the budget is spent."""
+    with _usage_lock:
+        if GEN_MAX_CALLS and USAGE["calls"] + n > GEN_MAX_CALLS:
+            raise RuntimeError(f"GEN_MAX_CALLS={GEN_MAX_CALLS} reached; not sending more OpenAI requests")
+        USAGE["calls"] += n
+
+def _add_tokens(n: Any) -> None:
+    with _usage_lock:
+        USAGE["tokens"] += n if isinstance(n, int) else 0
+
+# Models that answered "temperature not supported" during this run. Batch bodies are
+# built before any synchronous call, so GEN_NO_TEMP=1 is how they learn it up front.
+_NO_TEMP_MODELS: set = {GEN_MODEL, GEN_FALLBACK} if GEN_NO_TEMP else set()
+
+def _chat_messages(sys_msg: str, user_lines: List[str]) -> List[Dict[str, str]]:
+    return [{"role": "system", "content": sys_msg},
+            {"role": "user", "content": "\n".join(user_lines)}]
+
+def _completion_cache_path(messages: List[Dict[str, str]], temp: float) -> str:
+    # The user lines carry the date, refs and saint, so the key already pins the lectionary.
+    blob = json.dumps({"m": GEN_MODEL, "t": temp, "msgs": messages}, sort_keys=True, ensure_ascii=False)
+    return os.path.join(CACHE_DIR, "openai", hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest() + ".json")
+
+def _cached_completion(path: str) -> Any:
+    if GEN_NO_CACHE:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+# (cache path, raw completion) held back until the day(s) built from it are complete
+Pending = Optional[Tuple[str, str]]
 
-def gen_json(client, sys_msg: str, user_lines: List[str], temp: float) -> Dict[str, Any]:
-    from openai import BadRequestError
-    messages = [{"role": "system", "content": sys_msg},
-                {"role": "user", "content": "\n".join(user_lines)}]
+def save_completion(pending: Pending) -> None:
+    """Cache a completion once every day built from it came out complete."""
+    if pending:
+        write_text_atomic(*pending)
 
-    def _create(model, use_temp):
+def gen_json(client, sys_msg: str, user_lines: List[str], temp: float,
+             use_cache: bool = True) -> Tuple[Dict[str, Any], Pending]:
+    """
+    Parsed JSON completion plus its pending cache entry. Nothing is cached here:
+    a draft is only worth reusing once the caller has checked the day it produced.
+    `use_cache=False` skips the lookup (the day is being regenerated).
+    """
+    from openai import BadRequestError, NotFoundError
+    messages = _chat_messages(sys_msg, user_lines)
+
+    cache_path = _completion_cache_path(messages, temp)
+    cached = _cached_completion(cache_path) if use_cache else None
+    if cached is not None:
+        return cached, None
+
+    def _create(model):
         kw = {
             "model": model,
             "messages": messages,
             "response_format": {"type": "json_object"}
         }
-        if use_temp:
+        if model not in _NO_TEMP_MODELS:
             kw["temperature"] = temp
-        return client.chat.completions.create(**kw)
-
-    try:
+        _spend_calls()
         try:
-            r = _create(GEN_MODEL, True)
+            return client.chat.completions.create(**kw)
         except BadRequestError as e:
-            if "temperature" in str(e).lower():
-                r = _create(GEN_MODEL, False)
-            else:
+            if "temperature" not in kw or "temperature" not in str(e).lower():
                 raise
+            # Remember the rejection so later days go straight to the accepted form.
+            _NO_TEMP_MODELS.add(model)
+            del kw["temperature"]
+            _spend_calls()
+            return client.chat.completions.create(**kw)
+
+    try:
+        r = _with_backoff(lambda: _create(GEN_MODEL))
+    except (BadRequestError, NotFoundError) as e:
+        # Only a rejection of the model/request itself warrants the fallback model;
+        # transient errors were already retried above.
+        if GEN_FALLBACK == GEN_MODEL:
+            raise
+        log(f"{GEN_MODEL} rejected the request ({e}); falling back to {GEN_FALLBACK}")
+        r = _with_backoff(lambda: _create(GEN_FALLBACK))
+    _add_tokens(getattr(getattr(r, "usage", None), "total_tokens", 0))
+    content = r.choices[0].message.content
+    return json.loads(content), (cache_path, content)
+
+def gen_json_batch(client, sys_msg: str, jobs: Dict[str, List[str]], temp: float,
+                   fresh=frozenset()) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[List[str], Pending]]]:
+    """
+    Run one chat completion per job through the OpenAI Batch API and wait for it.
+    `jobs` maps custom_id -> user lines; ids in `fresh` skip the cache lookup.
+    Returns ({custom_id: parsed JSON}, [([custom_id], pending cache entry)]);
+    requests that errored or never finished are simply missing from the result.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[List[str], Pending]] = []
+    cache_paths: Dict[str, str] = {}
+    rows = []
+    for cid, user_lines in jobs.items():
+        messages = _chat_messages(sys_msg, user_lines)
+        cache_paths[cid] = _completion_cache_path(messages, temp)
+        cached = _cached_completion(cache_paths[cid]) if cid not in fresh else None
+        if cached is not None:
+            results[cid] = cached
+            continue
+        rows.append(json.dumps({
+            "custom_id": cid,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": GEN_MODEL,
+                "messages": messages,
+                "response_format": {"type": "json_object"},
+                **({} if GEN_MODEL in _NO_TEMP_MODELS else {"temperature": temp}),
+            },
+        }, ensure_ascii=False))
+    if not rows:
+        return results, pending
+
+    _spend_calls(len(rows))
+    try:
+        upload = _with_backoff(lambda: client.files.create(
+            file=("weeklyfeed-batch.jsonl", ("\n".join(rows) + "\n").encode("utf-8")),
+            purpose="batch",
+        ))
+        batch = _with_backoff(lambda: client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        ))
+    except Exception:
+        # Nothing was submitted, so give the reserved requests back to the budget.
+        with _usage_lock:
+            USAGE["calls"] -= len(rows)
+        raise
+    log(f"batch {batch.id} submitted ({len(rows)} requests)")
+
+    done = ("completed", "failed", "expired", "cancelled")
+    deadline = time.monotonic() + BATCH_MAX_WAIT
+    try:
+        delay = BATCH_POLL_SECS
+        while batch.status not in done:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TimeoutError(f"batch {batch.id} still {batch.status} after {BATCH_MAX_WAIT}s")
+            time.sleep(min(delay, left))
+            delay = min(delay * 2, 300)
+            batch = _with_backoff(lambda: client.batches.retrieve(batch.id))
+            log(f"batch {batch.id} status={batch.status}")
+
+        # Expired/cancelled batches can still carry partial output.
+        if not batch.output_file_id:
+            return results, pending
+        output = _with_backoff(lambda: client.files.content(batch.output_file_id)).text
     except Exception:
+        # The caller regenerates these days synchronously; don't keep paying for the batch too.
+        if batch.status not in done:
+            try:
+                _with_backoff(lambda: client.batches.cancel(batch.id))
+                log(f"batch {batch.id} cancelled")
+            except Exception as e:
+                log(f"could not cancel batch {batch.id}: {e}")
+        raise
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        rec = json.loads(line)
         try:
-            r = _create(GEN_FALLBACK, True)
-        except BadRequestError as e2:
-            if "temperature" in str(e2).lower():
-                r = _create(GEN_FALLBACK, False)
-            else:
-                raise
-    return json.loads(r.choices[0].message.content)
+            cid = rec["custom_id"]
+            body = rec["response"]["body"]
+            if "temperature" in str(body.get("error") or "") and GEN_MODEL not in _NO_TEMP_MODELS:
+                # Spare the per-day fallback the same rejection.
+                _NO_TEMP_MODELS.add(GEN_MODEL)
+                log(f"batch: {GEN_MODEL} rejected temperature; set GEN_NO_TEMP=1 for batch runs")
+            _add_tokens((body.get("usage") or {}).get("total_tokens", 0))
+            content = body["choices"][0]["message"]["content"]
+            results[cid] = json.loads(content)
+            pending.append(([cid], (cache_paths[cid], content)))
+        except Exception as e:
+            log("batch result unusable:", rec.get("custom_id"), e)
+    return results, pending
 
 STYLE_CARD = """ROLE: Catholic editor & theologian for FaithLinks.
 RULES:
@@ -475,6 +811,7 @@ RULES:
 - `psalmSummary` MUST summarize ONLY PSALM_REF.
 - If SECOND_READING_REF is empty, `secondReading` MUST be "".
 - Never treat the Alleluia as the Psalm.
+- `quote` and `quoteCitation` are NEVER empty; if unsure, quote a short line from GOSPEL_REF and cite it.
 - Summarize Scripture; ≤10 quoted words total.
 - Output only JSON with the contract keys.
 LENGTHS (words):
@@ -483,19 +820,103 @@ LENGTHS (words):
 - exegesis 750–1000 in 6–8 short paragraphs (Context:, Psalm:, Gospel:, Saints:, Today:).
 """
 
+MULTI_DAY_RULES = """
+MULTI-DAY REQUEST:
+- The input holds several days, each starting with a "=== DAY ===" line.
+- Return {"days": [...]} with exactly one object per input day, in input order.
+- Each object follows every rule above using only its own day's references.
+"""
+
+def gen_json_multiday(client, ctxs: List[Dict[str, Any]], temp: float,
+                      fresh=frozenset()) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[List[str], Pending]]]:
+    """
+    Generate GEN_MULTIDAY days per chat completion so the style card is sent once
+    per group instead of once per day. Returns ({iso: draft}, [(group isos, pending
+    cache entry)]); days a response skipped or mangled are simply missing from the
+    result. A group holding a day in `fresh` skips the cache lookup.
+    """
+    groups = [ctxs[i:i + GEN_MULTIDAY] for i in range(0, len(ctxs), GEN_MULTIDAY)]
+
+    def _one(group: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Pending]:
+        lines: List[str] = []
+        for c in group:
+            lines += ["=== DAY ===", *c["lines"]]
+        use_cache = not any(c["iso"] in fresh for c in group)
+        try:
+            out, pend = gen_json(client, STYLE_CARD + MULTI_DAY_RULES, lines, temp, use_cache)
+        except Exception as e:
+            log(f"multi-day call for {group[0]['iso']}..{group[-1]['iso']} failed: {e}")
+            return {}, None
+        days = out.get("days") if isinstance(out, dict) else None
+        if not isinstance(days, list):
+            return {}, None
+        days = [d for d in days if isinstance(d, dict)]
+        by_iso = {_sfield(d, "date"): d for d in days if _sfield(d, "date")}
+        if by_iso:
+            # Dated replies are matched by date only; a position could hand one
+            # day another day's prose (or the same draft twice).
+            res = {c["iso"]: by_iso[c["iso"]] for c in group if c["iso"] in by_iso}
+        elif len(days) == len(group):
+            res = {c["iso"]: d for c, d in zip(group, days)}
+        else:
+            res = {}
+        return res, pend
+
+    results: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[List[str], Pending]] = []
+    with ThreadPoolExecutor(max_workers=min(GEN_CONCURRENCY, len(groups))) as pool:
+        for group, (res, pend) in zip(groups, pool.map(_one, groups)):
+            results.update(res)
+            pending.append(([c["iso"] for c in group], pend))
+    return results, pending
+
+# ===== Normalize =====
+REQ = [
+    "date", "quote", "quoteCitation", "firstReading", "secondReading", "psalmSummary", "gospelSummary",
+    "saintReflection", "dailyPrayer", "theologicalSynthesis", "exegesis", "usccbLink", "cycle", "weekdayCycle",
+    "feast", "gospelReference", "firstReadingRef", "secondReadingRef", "psalmRef", "gospelRef", "lectionaryKey"
+]
+
+def _tag(t: Any) -> str:
+    return str(t).strip().lower().replace(" ", "-")[:32]
+
+# Output key order (same as RETURN KEYS in the prompt); any other key the model adds is dropped.
+KEY_ORDER = [
+    "date", "quote", "quoteCitation", "firstReading", "secondReading", "psalmSummary", "gospelSummary",
+    "saintReflection", "dailyPrayer", "theologicalSynthesis", "exegesis", "tags", "usccbLink", "cycle",
+    "weekdayCycle", "feast", "gospelReference", "firstReadingRef", "secondReadingRef", "psalmRef", "gospelRef",
+    "lectionaryKey"
+]
+
+def normalize_entry(r: Dict[str, Any], lead_tags: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """New entry in KEY_ORDER: REQ fields coerced to str, tags slugified (`lead_tags` first)."""
+    out: Dict[str, Any] = {}
+    for k in KEY_ORDER:
+        v = r.get(k)
+        if k == "tags":
+            tags = v if isinstance(v, list) else []
+            out[k] = [_tag(t) for t in [*lead_tags, *tags][:12]]
+        else:
+            out[k] = v if isinstance(v, str) else ("" if v is None else str(v))
+    return out
+
 # ===== Builder =====
-def build_day_payload(date: dt.date) -> Dict[str, Any]:
+@load_once
+def readings_overrides() -> Dict[str, Dict[str, str]]:
+    return load_json("public/readings-overrides.json", {})
+
+def prepare_day(date: dt.date) -> Dict[str, Any]:
+    """Resolve readings + saint for `date` and build the prompt (no OpenAI calls)."""
     iso = ymd(date)
-    usccb_link = f"https://bible.usccb.org/bible/readings/{date.strftime('%m%d%y')}.cfm"
+    link = usccb_link(date)
 
     first_ref, second_ref, psalm_ref, gospel_ref = resolve_readings(date)
 
-    overrides = load_json("public/readings-overrides.json", {})
-    over = overrides.get(iso, {})
-    first_ref  = over.get("firstRef",  first_ref)
-    second_ref = over.get("secondRef", second_ref)
-    psalm_ref  = over.get("psalmRef",  psalm_ref)
-    gospel_ref = over.get("gospelRef", gospel_ref)
+    over = readings_overrides().get(iso, {})
+    first_ref  = _sfield(over, "firstRef",  first_ref)
+    second_ref = _sfield(over, "secondRef", second_ref)
+    psalm_ref  = _sfield(over, "psalmRef",  psalm_ref)
+    gospel_ref = _sfield(over, "gospelRef", gospel_ref)
 
     # === HARD INVARIANTS ===
     core_missing = []
@@ -510,21 +931,22 @@ def build_day_payload(date: dt.date) -> Dict[str, Any]:
         msg = f"{iso}: missing core reading(s): {', '.join(core_missing)}"
         if USCCB_STRICT:
             raise SystemExit(msg)
-        log("warn:", msg)
+        # The finished entry could never be complete, so fail this day before paying for a draft.
+        raise ValueError(msg)
 
     if is_sunday(date) and not second_ref:
         log(f"warn: {iso} is Sunday and has no second reading ref")
 
     saint = saint_for_date(date)
     # Use data from scraper/JSON, or empty strings if not found
-    saint_name = saint.get('saintName', '')
-    saint_profile = saint.get('profile', '')
-    saint_link = saint.get('link', '')
-    feast = saint.get("memorial", "")
+    saint_name = _sfield(saint, "saintName")
+    saint_profile = _sfield(saint, "profile")
+    saint_link = _sfield(saint, "link")
+    feast = _sfield(saint, "memorial")
 
     lines = [
         f"DATE: {iso}",
-        f"USCCB_LINK: {usccb_link}",
+        f"USCCB_LINK: {link}",
         f"FIRST_READING_REF: {first_ref}",
         f"SECOND_READING_REF: {second_ref}",
         f"PSALM_REF: {psalm_ref}",
@@ -537,13 +959,27 @@ def build_day_payload(date: dt.date) -> Dict[str, Any]:
         "gospelReference, firstReadingRef, secondReadingRef, psalmRef, gospelRef, lectionaryKey]"
     ]
 
-    client = openai_client()
-    out = gen_json(client, STYLE_CARD, lines, GEN_TEMP)
+    return {
+        "date": date,
+        "iso": iso,
+        "usccbLink": link,
+        "refs": (first_ref, second_ref, psalm_ref, gospel_ref),
+        "saintName": saint_name,
+        "feast": feast,
+        "lines": lines,
+    }
+
+def finish_day(ctx: Dict[str, Any], out: Any) -> Dict[str, Any]:
+    """Merge the model output with the scraped facts for one day."""
     if not isinstance(out, dict):
         out = {}
 
+    date, iso = ctx["date"], ctx["iso"]
+    first_ref, second_ref, psalm_ref, gospel_ref = ctx["refs"]
+    saint_name = ctx["saintName"]
+
     out["date"] = iso
-    out["usccbLink"] = usccb_link
+    out["usccbLink"] = ctx["usccbLink"]
     out["firstReadingRef"]  = first_ref
     out["secondReadingRef"] = second_ref
     out["psalmRef"]         = psalm_ref
@@ -551,7 +987,7 @@ def build_day_payload(date: dt.date) -> Dict[str, Any]:
     out["gospelReference"]  = gospel_ref
     out["cycle"]        = compute_year_cycle(date)
     out["weekdayCycle"] = compute_weekday_cycle(date)
-    out["feast"]        = feast
+    out["feast"]        = ctx["feast"]
     out["lectionaryKey"] = f"{iso}:{first_ref}|{second_ref}|{psalm_ref}|{gospel_ref}"
 
     # Ensure saint-related fields in the AI output match our scraped data if the AI hallucinated something else
@@ -561,39 +997,137 @@ def build_day_payload(date: dt.date) -> Dict[str, Any]:
     if not _s(second_ref):
         out["secondReading"] = ""
 
-    for k in [
-        "date", "quote", "quoteCitation", "firstReading", "secondReading", "psalmSummary", "gospelSummary",
-        "saintReflection", "dailyPrayer", "theologicalSynthesis", "exegesis", "usccbLink", "cycle", "weekdayCycle",
-        "feast", "gospelReference", "firstReadingRef", "secondReadingRef", "psalmRef", "gospelRef", "lectionaryKey"
-    ]:
-        out[k] = _s(out.get(k, ""))
+    # The prompt steers quotes to the Gospel, so an uncited quote is attributed there.
+    if _sfield(out, "quote") and not _sfield(out, "quoteCitation"):
+        out["quoteCitation"] = gospel_ref
 
-    tags = out.get("tags", [])
-    if not isinstance(tags, list):
-        tags = []
-    
     # Auto-tag the saint name if present
-    if saint_name:
-        tags.insert(0, saint_name)
-        
-    out["tags"] = [str(t).strip().lower().replace(" ", "-")[:32] for t in tags][:12]
-    return out
-
-# ===== Final normalize =====
-REQ = [
-    "date", "quote", "quoteCitation", "firstReading", "secondReading", "psalmSummary", "gospelSummary",
-    "saintReflection", "dailyPrayer", "theologicalSynthesis", "exegesis", "usccbLink", "cycle", "weekdayCycle",
-    "feast", "gospelReference", "firstReadingRef", "secondReadingRef", "psalmRef", "gospelRef", "lectionaryKey"
+    row = normalize_entry(out, lead_tags=(saint_name,) if saint_name else ())
+    # Checked per day so a bad entry fails only that day and is never checkpointed.
+    # Refs were checked in prepare_day; the schema has no minLength, so the prose
+    # check is the real gate and the schema is a backstop.
+    need = CONTENT_FIELDS + (["secondReading"] if second_ref else [])
+    empty = [k for k in need if not row[k].strip()]
+    if empty:
+        raise ValueError(f"incomplete entry; empty: {', '.join(empty)}")
+    return validate_entry(row)
+
+def build_day_payload(date: dt.date, client, use_cache: bool = True) -> Dict[str, Any]:
+    ctx = prepare_day(date)
+    out, pending = gen_json(client, STYLE_CARD, ctx["lines"], GEN_TEMP, use_cache)
+    row = finish_day(ctx, out)
+    save_completion(pending)
+    return row
+
+@load_once
+def entry_validator():
+    """Validator for a single feed entry (the schema's `items`), or None if jsonschema/schema are missing."""
+    schema = load_json(SCHEMA_PATH, None)
+    if Draft202012Validator is None or not isinstance(schema, dict):
+        return None
+    return Draft202012Validator(schema.get("items", schema))
+
+def validate_entry(r: Dict[str, Any]) -> Dict[str, Any]:
+    v = entry_validator()
+    if v is not None and not v.is_valid(r):
+        errs = "; ".join(f"{'/'.join(map(str, e.path)) or '(root)'}: {e.message}" for e in v.iter_errors(r))
+        raise ValueError(f"schema check failed: {errs}")
+    return r
+
+# Generated prose an entry must carry; saintReflection may be blank on simple weekdays
+CONTENT_FIELDS = [
+    "quote", "quoteCitation", "firstReading", "psalmSummary", "gospelSummary",
+    "dailyPrayer", "theologicalSynthesis", "exegesis",
 ]
 
-def normalize_rows(rows: List[Dict[str, Any]]):
-    for r in rows:
-        for k in REQ:
-            r[k] = _s(r.get(k, ""))
-        tags = r.get("tags", [])
-        if not isinstance(tags, list):
-            tags = []
-        r["tags"] = [str(t).strip().lower().replace(" ", "-")[:32] for t in tags][:12]
+def entry_is_complete(e: Any, d: dt.date) -> bool:
+    """True if `e` is a finished entry for `d` (all contract keys, prose and refs filled in)."""
+    iso = ymd(d)
+    if not isinstance(e, dict) or e.get("date") != iso:
+        return False
+    if any(k not in e for k in REQ) or not isinstance(e.get("tags"), list):
+        return False
+    if any(not _sfield(e, k) for k in CONTENT_FIELDS + ["firstReadingRef", "psalmRef", "gospelRef"]):
+        return False
+    if _sfield(e, "secondReadingRef") and not _sfield(e, "secondReading"):
+        return False
+    return _s(e.get("lectionaryKey")).startswith(f"{iso}:")
+
+# readings-overrides.json key -> feed field it pins
+OVERRIDE_FIELDS = {
+    "firstRef": "firstReadingRef", "secondRef": "secondReadingRef",
+    "psalmRef": "psalmRef", "gospelRef": "gospelRef",
+}
+
+def entry_overrides_differ(e: Dict[str, Any], d: dt.date) -> bool:
+    """True if readings-overrides.json pins a ref for `d` that `e` does not carry."""
+    over = readings_overrides().get(ymd(d), {})
+    return any(
+        over.get(k) is not None and _sfield(over, k) != _sfield(e, f)
+        for k, f in OVERRIDE_FIELDS.items()
+    )
+
+def generate_rows(dates: List[dt.date], on_row, fresh=frozenset()) -> List[str]:
+    """
+    Build fresh entries for `dates` via chat completions (one or GEN_MULTIDAY days
+    per call) or the Batch API, passing each finished row to `on_row` as soon as it
+    is ready. A day that raises is logged and skipped; returns the ISO dates that failed.
+    Days in `fresh` (ISO dates) bypass cached completions.
+    """
+    # Each day is network-bound (scrapes + one chat completion), so run them
+    # side by side on a shared client.
+    client = openai_client()
+    grouped = GEN_BATCH or GEN_MULTIDAY > 1
+    failed: List[str] = []
+    ctxs = []
+    with ThreadPoolExecutor(max_workers=min(GEN_CONCURRENCY, len(dates))) as pool:
+        if grouped:
+            futs = {pool.submit(prepare_day, d): ymd(d) for d in dates}
+        else:
+            futs = {pool.submit(build_day_payload, d, client, ymd(d) not in fresh): ymd(d) for d in dates}
+        for fut in as_completed(futs):
+            try:
+                res = fut.result()
+            except Exception as e:
+                log(f"!! {futs[fut]} failed: {e}")
+                failed.append(futs[fut])
+                continue
+            if grouped:
+                ctxs.append(res)
+            else:
+                on_row(res)
+    if not ctxs:
+        return failed
+
+    ctxs.sort(key=lambda c: c["iso"])
+    try:
+        if GEN_BATCH:
+            drafts, pending = gen_json_batch(client, STYLE_CARD, {c["iso"]: c["lines"] for c in ctxs}, GEN_TEMP, fresh)
+        else:
+            drafts, pending = gen_json_multiday(client, ctxs, GEN_TEMP, fresh)
+    except Exception as e:
+        # e.g. upload failed after retries, or GEN_MAX_CALLS cannot cover the batch;
+        # each day then goes through the single-day path and its own error handling.
+        log(f"!! grouped generation failed: {e}")
+        drafts, pending = {}, []
+    complete = set()
+    for c in ctxs:
+        try:
+            out = drafts.get(c["iso"])
+            if out is None:
+                log(f"{c['iso']}: missing from grouped output; generating on its own")
+                out, pend = gen_json(client, STYLE_CARD, c["lines"], GEN_TEMP, c["iso"] not in fresh)
+                pending.append(([c["iso"]], pend))
+            on_row(finish_day(c, out))
+            complete.add(c["iso"])
+        except Exception as e:
+            log(f"!! {c['iso']} failed: {e}")
+            failed.append(c["iso"])
+    # A shared completion is only reused if every day built from it came out complete.
+    for isos, pend in pending:
+        if all(i in complete for i in isos):
+            save_completion(pend)
+    return failed
 
 # ===== Main =====
 def main():
@@ -631,21 +1165,61 @@ def main():
     else:
         start = today_local()
 
-    log(f"tz={APP_TZ} start={start} days={days} model={GEN_MODEL}")
+    log(f"tz={APP_TZ} start={start} days={days} model={GEN_MODEL} concurrency={GEN_CONCURRENCY}")
 
-    rows = []
-    for d in daterange(start, days):
-        t0 = time.time()
-        rows.append(build_day_payload(d))
-        elapsed = time.time() - t0
-        if elapsed < 0.7:
-            time.sleep(0.7 - elapsed)
-
-    normalize_rows(rows)
-    os.makedirs("public", exist_ok=True)
-    with open("public/weeklyfeed.json", "w", encoding="utf-8") as f:
-        json.dump(rows, f, ensure_ascii=False, indent=2)
-    log(f"Wrote public/weeklyfeed.json ({len(rows)} days)")
+    dates = daterange(start, days)
+    # Only entries inside the window are ever written back, so index just those.
+    wanted = {ymd(d) for d in dates}
+    by_date = {
+        str(e.get("date")): e for e in load_json(WEEKLY_PATH, [])
+        if isinstance(e, dict) and str(e.get("date")) in wanted
+    }
+
+    # Reruns only pay for days that are missing, incomplete or out of step with
+    # readings-overrides.json (GEN_FORCE=1 regenerates all).
+    todo = []
+    for d in dates:
+        e = by_date.get(ymd(d))
+        if GEN_FORCE or not entry_is_complete(e, d):
+            todo.append(d)
+        elif entry_overrides_differ(e, d):
+            log(f"{ymd(d)}: refs differ from readings-overrides.json; regenerating")
+            todo.append(d)
+        else:
+            log(f"{ymd(d)}: already complete in {WEEKLY_PATH}; skipping")
+
+    # finish_day already normalizes fresh rows; kept rows are normalized here, once.
+    by_date = {k: normalize_entry(e) for k, e in by_date.items()}
+
+    # Checkpoint the feed after every finished day so a failed or cancelled run
+    # keeps what it paid for; the rerun then skips those days.
+    def write_feed() -> Tuple[List[Dict[str, Any]], bool]:
+        rows = [by_date[ymd(d)] for d in dates if ymd(d) in by_date]
+        return rows, write_bytes_if_changed(WEEKLY_PATH, dump_json_pretty(rows))
+
+    # Checkpoints usually leave the final write nothing to do, so track changes across all writes.
+    changed_any = False
+
+    def checkpoint(row: Dict[str, Any]):
+        nonlocal changed_any
+        by_date[row["date"]] = row
+        changed_any |= write_feed()[1]
+        log(f"{row['date']}: done; checkpointed {WEEKLY_PATH}")
+
+    # A day that already has an entry is being redone because that entry fell
+    # short, so its cached completion (if any) must not be served again.
+    fresh = {ymd(d) for d in todo if ymd(d) in by_date}
+    failed = generate_rows(todo, checkpoint, fresh) if todo else []
+    if by_date:
+        rows, changed = write_feed()
+        changed_any |= changed
+        log(f"{'Wrote' if changed_any else 'Unchanged'} {WEEKLY_PATH} ({len(rows)} days)")
+    else:
+        # Nothing to publish (e.g. every day failed): leave the existing feed alone.
+        log(f"No rows for this window; {WEEKLY_PATH} left as is")
+    log(f"OpenAI usage: {USAGE['calls']} request(s), {USAGE['tokens']} tokens")
+    if failed:
+        raise SystemExit(f"{len(failed)} day(s) failed: {', '.join(sorted(failed))}")
 
 if __name__ == "__main__":
     main()
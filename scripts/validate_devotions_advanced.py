@@ -3,7 +3,8 @@
 import json
 import pathlib
 import sys
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 files_and_schemas = [
     # Each tuple is (path to JSON file, path to its schema)
@@ -38,13 +39,15 @@ for json_fname, schema_fname in files_and_schemas:
         exit_code = 1
         continue
 
-    # Validate
-    try:
-        validate(instance=data, schema=schema)
+    # Validate: one validator per schema; errors are only walked when the quick check fails
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    if validator.is_valid(data):
         count = len(data) if isinstance(data, list) else 1
         print(f"{json_fname} is valid ({count} entr{'y' if count==1 else 'ies'})")
-    except ValidationError as e:
-        print(f"Validation error in {json_fname}:", e.message)
+    else:
+        print(f"Validation error in {json_fname}:", best_match(validator.iter_errors(data)).message)
         exit_code = 1
 
 sys.exit(exit_code)
\ No newline at end of file
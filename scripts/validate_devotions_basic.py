@@ -2,7 +2,8 @@
 import json
 import pathlib
 import sys
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 schema_path = pathlib.Path("schemas/devotion.schema.json")
 json_path   = pathlib.Path("public/devotions.json")
@@ -26,10 +27,12 @@ except Exception as e:
     print("Failed to load JSON:", e)
     sys.exit(1)
 
-# Validate
-try:
-    validate(instance=data, schema=schema)
+# Validate: build the validator once; errors are only walked when the quick check fails
+cls = validator_for(schema)
+cls.check_schema(schema)
+validator = cls(schema)
+if validator.is_valid(data):
     print("public/devotions.json is valid")
-except ValidationError as e:
-    print("Validation error:", e.message)
+else:
+    print("Validation error:", best_match(validator.iter_errors(data)).message)
     sys.exit(1)
@@ -4,9 +4,14 @@
 from __future__ import annotations
 import argparse, json, os, sys, re, urllib.request, tempfile
 from datetime import datetime, timedelta, date
+from operator import itemgetter
 from pathlib import Path
 from zoneinfo import ZoneInfo
 from typing import Any, Dict, List, Optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ---------- Paths ----------
 BASE_DIR = Path(__file__).resolve().parent
@@ -24,13 +29,23 @@ SAINT_URL = "https://dailylectio.org/saint.json"
 def iso(d: date) -> str:
     return d.isoformat()
 
+def dump_json(obj) -> bytes:
+    # Compact UTF-8 + trailing newline; orjson and the stdlib fallback emit the same bytes.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+def read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
 def atomic_write_json(path: Path, obj) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(prefix=path.name, dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
-            f.write("\n")
+        with os.fdopen(fd, "wb") as f:
+            f.write(dump_json(obj))
         os.replace(tmp, path)
     finally:
         try:
@@ -49,7 +64,7 @@ def parse_args() -> argparse.Namespace:
 
 def load_weekly(path: Path) -> list[dict]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = read_json(path)
     except Exception as e:
         print(f"[error] Failed reading {path}: {e}", file=sys.stderr)
         sys.exit(1)
@@ -149,29 +164,27 @@ BOOKS = [
     "1 John","2 John","3 John","Jude","Revelation"
 ]
 
+# Compiled once; auto_tags runs every pattern against every entry
+THEME_RES = [(re.compile(pat, re.IGNORECASE), tag) for pat, tag in THEME_MAP.items()]
+BOOK_RES = [(re.compile(rf"\b{re.escape(book)}\b"), book.lower()) for book in BOOKS]
+TEXT_KEYS = ("quote","firstReading","psalmSummary","gospelSummary","saintReflection","theologicalSynthesis","exegesis","dailyPrayer")
+REF_KEYS = ("firstReadingRef","psalmRef","gospelRef","secondReadingRef","quoteCitation")
+
 def auto_tags(entry: Dict[str, Any], saint_used: bool) -> list[str]:
     existing = entry.get("tags")
     if isinstance(existing, list) and any(str(x).strip() for x in existing):
         return [str(x).strip() for x in existing if str(x).strip()]
 
-    text_blob = " ".join(
-        str(entry.get(k,"")) for k in
-        ("quote","firstReading","psalmSummary","gospelSummary","saintReflection","theologicalSynthesis","exegesis","dailyPrayer")
-        if isinstance(entry.get(k), str)
-    )
-    refs_blob = " ".join(
-        str(entry.get(k,"")) for k in
-        ("firstReadingRef","psalmRef","gospelRef","secondReadingRef","quoteCitation")
-        if isinstance(entry.get(k), str)
-    )
+    text_blob = " ".join(v for v in map(entry.get, TEXT_KEYS) if isinstance(v, str))
+    refs_blob = " ".join(v for v in map(entry.get, REF_KEYS) if isinstance(v, str))
 
     tags: list[str] = []
-    for pat, tag in THEME_MAP.items():
-        if re.search(pat, text_blob, flags=re.IGNORECASE):
+    for pat, tag in THEME_RES:
+        if pat.search(text_blob):
+            tags.append(tag)
+    for pat, tag in BOOK_RES:
+        if pat.search(refs_blob):
             tags.append(tag)
-    for book in BOOKS:
-        if re.search(rf"\b{re.escape(book)}\b", refs_blob):
-            tags.append(book.lower())
     if saint_used:
         tags.insert(0, "saints")
 
@@ -201,7 +214,7 @@ def archive_entry(entry: dict) -> None:
     atomic_write_json(path, entry)
     # index update
     try:
-        idx = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
+        idx = read_json(INDEX_PATH)
         if not isinstance(idx, list): idx = []
     except Exception:
         idx = []
@@ -219,7 +232,7 @@ def archive_entry(entry: dict) -> None:
     # replace by date, keep sorted desc
     by_date = {r.get("date"): r for r in idx if isinstance(r, dict)}
     by_date[d] = row
-    new_idx = sorted(by_date.values(), key=lambda r: r["date"], reverse=True)
+    new_idx = sorted(by_date.values(), key=itemgetter("date"), reverse=True)
     atomic_write_json(INDEX_PATH, new_idx)
     print(f"[ok] archived {d} → {path}")
 